@@ -32,6 +32,9 @@ class Settings(BaseSettings):
         GROQ_MODEL (str): Model identifier used for Groq API calls.
         EMBEDDINGS_MODEL (str): HuggingFace model name for embeddings generation.
         PERSIST_DIRECTORY (str): File system path for vector store persistence.
+        STARTUP_PROFILE (bool): Whether to report per-component startup timings.
+        BACKGROUND_WARMUP (bool): Whether to warm up heavy components in the background after startup.
+        WARMUP_DELAY_SECONDS (float): Delay between graph import and the background warmup.
     """
     
     # LLM Configuration
@@ -50,6 +53,11 @@ class Settings(BaseSettings):
     LANGSMITH_PROJECT: str = Field(..., env="LANGSMITH_PROJECT")
     LANGSMITH_TRACING: bool = Field(..., env="LANGSMITH_TRACING")
 
+    # Startup Configuration
+    STARTUP_PROFILE: bool = Field(False, env="STARTUP_PROFILE", description="Log import and initialization time per component")
+    BACKGROUND_WARMUP: bool = Field(True, env="BACKGROUND_WARMUP", description="Load models, vector store and reranker in a background thread after startup")
+    WARMUP_DELAY_SECONDS: float = Field(2.0, env="WARMUP_DELAY_SECONDS", description="Seconds to wait after graph import before the background warmup starts")
+
 
     class Config:
         """Pydantic model configuration settings."""
@@ -0,0 +1,135 @@
+"""
+Startup Profiling Module.
+
+This module records how long imports and component initialization take while
+the application starts up. Timings are only logged when STARTUP_PROFILE is
+enabled, so the tracking itself is cheap enough to leave in place.
+
+The module can also be run directly to print a full startup report, importing
+each application module in dependency order and then running the warmup hook
+synchronously:
+
+    python -m src.config.profiler
+
+Example:
+    from src.config.profiler import profiler
+
+    with profiler.track("import langchain_groq"):
+        from langchain_groq import ChatGroq
+"""
+
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+from src.config.config import settings
+from src.config.logger import logger
+
+class StartupProfiler:
+    """
+    Collects wall-clock timings for startup steps.
+
+    Attributes:
+        enabled (bool): Whether timings are written to the log as they are recorded.
+        timings (List[Tuple[str, float, bool]]): Recorded (label, seconds, succeeded)
+            entries in completion order.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize a StartupProfiler object.
+
+        Args:
+            enabled (bool, optional): Log each timing as it is recorded. Defaults to False.
+        """
+        self.enabled = enabled
+        self.timings: List[Tuple[str, float, bool]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, label: str) -> Iterator[None]:
+        """
+        Time the enclosed block and record it under the given label.
+
+        A block that raises is recorded as failed and the exception propagates.
+
+        Args:
+            label (str): Name of the import or initialization step.
+        """
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.timings.append((label, elapsed, succeeded))
+            if self.enabled:
+                status = "" if succeeded else " (failed)"
+                logger.info(f"[startup] {label}: {elapsed * 1000:.1f} ms{status}")
+
+    def report(self) -> str:
+        """
+        Format the recorded timings as a table, slowest first.
+
+        Steps recorded more than once under the same label are merged into one
+        row with their total time and call count, and failures are flagged.
+
+        Returns:
+            str: One line per distinct step.
+        """
+        rows: Dict[str, List[float]] = {}
+        with self._lock:
+            for label, seconds, succeeded in self.timings:
+                total, calls, failures = rows.get(label, [0.0, 0, 0])
+                rows[label] = [total + seconds, calls + 1, failures + (not succeeded)]
+
+        lines = []
+        for label, (total, calls, failures) in sorted(rows.items(), key=lambda item: item[1][0], reverse=True):
+            notes = []
+            if calls > 1:
+                notes.append(f"x{calls}")
+            if failures:
+                notes.append("FAILED" if failures == calls else f"{failures} failed")
+            suffix = f"  [{', '.join(notes)}]" if notes else ""
+            lines.append(f"{total * 1000:10.1f} ms  {label}{suffix}")
+        return "\n".join(lines)
+
+profiler = StartupProfiler(enabled=settings.STARTUP_PROFILE)
+
+APP_MODULES = [
+    "src.utils.state",
+    "src.utils.llm",
+    "src.utils.edge",
+    "src.utils.node",
+    "src.utils.workflow",
+]
+
+def main() -> None:
+    """Import the application modules, run the warmup hook and print the timings."""
+    # Run as `python -m`, this file is `__main__`; the application modules import
+    # it again as src.config.profiler, so record into that shared instance.
+    from src.config.profiler import profiler as shared
+
+    shared.enabled = True
+    settings.BACKGROUND_WARMUP = False
+    for module in APP_MODULES:
+        with shared.track(f"import {module}"):
+            importlib.import_module(module)
+
+    from src.utils.workflow import warmup
+    error = None
+    try:
+        with shared.track("warmup"):
+            warmup(background=False)
+    except Exception as e:
+        error = e
+
+    print(shared.report())
+    if error is not None:
+        print(f"\nWarmup failed: {error}")
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,29 @@ This module provides a centralized service for managing language model operation
 including embedding generation, vector storage, and document retrieval capabilities.
 It handles initialization and configuration of various LLM components.
 
+Heavy libraries (langchain_groq, langchain_huggingface, langchain_chroma) are only
+imported when the corresponding component is first requested, so importing this
+module is cheap. Call `llm_service.warmup()` to load everything ahead of the first
+request.
+
 Example:
-    from src.utils.llm import llm, retriever, embeddings
-    
-    response = llm.predict("What is RAG?")
-    similar_docs = retriever.get_relevant_documents("query")
+    from src.utils.llm import llm_service
+
+    response = llm_service.get_llm().invoke("What is RAG?")
+    similar_docs = llm_service.get_retriever().invoke("query")
 """
 
-from typing import Any
-from langchain_huggingface.embeddings import HuggingFaceEmbeddings
-from langchain_chroma import Chroma
-from langchain_groq import ChatGroq
+import threading
+from typing import TYPE_CHECKING
 from src.config.config import settings
 from src.config.logger import logger
+from src.config.profiler import profiler
+
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+    from langchain_core.retrievers import BaseRetriever
+    from langchain_groq import ChatGroq
+    from langchain_huggingface.embeddings import HuggingFaceEmbeddings
 
 class LLMService:
     """
@@ -29,105 +39,168 @@ class LLMService:
     - Vector store operations
     - Document retrieval functionality
 
-    Each component is initialized lazily upon first use to optimize resource usage.
+    Each component is initialized lazily upon first use to optimize resource usage,
+    and cached so that the embedding model is loaded only once.
     """
 
-    def _initialize_llm(self) -> ChatGroq:
+    def __init__(self):
+        """Initialize an empty service; components are created on first access."""
+        self._llm = None
+        self._embeddings = None
+        self._retriever = None
+        self._llm_lock = threading.Lock()
+        self._embeddings_lock = threading.Lock()
+        self._retriever_lock = threading.Lock()
+
+    def get_llm(self) -> "ChatGroq":
+        """
+        Return the shared chat model, initializing it on first call.
+
+        Components are exposed through methods rather than properties because
+        LangGraph resolves attribute accesses it finds in node source code while
+        compiling the graph, which would otherwise trigger initialization at import.
+
+        Returns:
+            ChatGroq: Configured chat model ready for text generation
+        """
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    self._llm = self._initialize_llm()
+        return self._llm
+
+    def get_embeddings(self) -> "HuggingFaceEmbeddings":
+        """
+        Return the shared embedding model, initializing it on first call.
+
+        Returns:
+            HuggingFaceEmbeddings: Ready-to-use embedding model
+        """
+        if self._embeddings is None:
+            with self._embeddings_lock:
+                if self._embeddings is None:
+                    self._embeddings = self._initialize_embeddings()
+        return self._embeddings
+
+    def get_retriever(self) -> "BaseRetriever":
+        """
+        Return the shared vector store retriever, initializing it on first call.
+
+        Returns:
+            BaseRetriever: Configured similarity search retriever
+
+        Example:
+            retriever = llm_service.get_retriever()
+            docs = retriever.invoke("query")
+        """
+        if self._retriever is None:
+            with self._retriever_lock:
+                if self._retriever is None:
+                    self._retriever = self._initialize_retriever()
+        return self._retriever
+
+    def _initialize_llm(self) -> "ChatGroq":
         """
         Initialize and configure the Groq Language Model instance.
-        
+
         Creates a ChatGroq instance using configuration from settings:
         - Model identifier from GROQ_MODEL
         - Authentication from GROQ_API_KEY
-        
+
         Returns:
             ChatGroq: Configured chat model ready for text generation
-        
+
         Raises:
             RuntimeError: On API, authentication, or configuration failures
         """
         logger.info("Initializing Language Model...")
         try:
-            llm = ChatGroq(
-                model=settings.GROQ_MODEL, 
-                api_key=settings.GROQ_API_KEY,
-            
-            )
+            with profiler.track("import langchain_groq"):
+                from langchain_groq import ChatGroq
+            with profiler.track("init ChatGroq"):
+                llm = ChatGroq(
+                    model=settings.GROQ_MODEL,
+                    api_key=settings.GROQ_API_KEY,
+
+                )
             logger.info("Language Model initialized successfully")
             return llm
         except Exception as e:
             logger.error(f"Failed to initialize Language Model: {str(e)}")
             raise RuntimeError(f"Error initializing Language Model: {e}")
 
-    def _initialize_embeddings(self) -> HuggingFaceEmbeddings:
+    def _initialize_embeddings(self) -> "HuggingFaceEmbeddings":
         """
         Set up the text embedding model using HuggingFace.
-        
+
         Configures an embedding model that:
         - Converts text to vector representations
         - Uses the model specified in EMBEDDINGS_MODEL setting
         - Supports document similarity operations
-        
+
         Returns:
             HuggingFaceEmbeddings: Ready-to-use embedding model
-        
+
         Raises:
             RuntimeError: If model loading or initialization fails
         """
         logger.info(f"Initializing embeddings with model: {settings.EMBEDDINGS_MODEL}")
         try:
-            embeddings = HuggingFaceEmbeddings(model_name=settings.EMBEDDINGS_MODEL)
+            with profiler.track("import langchain_huggingface"):
+                from langchain_huggingface.embeddings import HuggingFaceEmbeddings
+            with profiler.track("init HuggingFaceEmbeddings"):
+                embeddings = HuggingFaceEmbeddings(model_name=settings.EMBEDDINGS_MODEL)
             logger.info("Embeddings model initialized successfully")
             return embeddings
         except Exception as e:
             logger.error(f"Failed to initialize embeddings: {str(e)}")
             raise RuntimeError(f"Error initializing embeddings: {e}")
 
-    def _initialize_vectorstore(self) -> Chroma:
+    def _initialize_vectorstore(self) -> "Chroma":
         """
         Configure the Chroma vector database for document storage.
-        
+
         Creates a persistent vector store that:
         - Integrates with the configured embedding model
         - Maintains persistence in PERSIST_DIRECTORY
         - Provides similarity search capabilities
-        
+
         Returns:
             Chroma: Configured vector store instance
-        
+
         Raises:
             RuntimeError: On storage initialization or embedding setup failures
         """
         logger.info("Initializing vector store...")
         try:
-            vectordb = Chroma(
-                persist_directory=settings.PERSIST_DIRECTORY, 
-                embedding_function=self._initialize_embeddings()
-            )
+            with profiler.track("import langchain_chroma"):
+                from langchain_chroma import Chroma
+            embeddings = self.get_embeddings()
+            with profiler.track("init Chroma"):
+                vectordb = Chroma(
+                    persist_directory=settings.PERSIST_DIRECTORY,
+                    embedding_function=embeddings
+                )
             logger.info("Vector store initialized successfully")
             return vectordb
         except Exception as e:
             logger.error(f"Failed to initialize vector store: {str(e)}")
             raise RuntimeError(f"Error initializing vector store: {e}")
 
-    def get_retriever(self) -> Any:
+    def _initialize_retriever(self) -> "BaseRetriever":
         """
         Create a document retriever for similarity search operations.
-        
+
         Configures a retriever with:
         - Cosine similarity search
         - Top-10 document retrieval
         - Integration with the vector store
-        
+
         Returns:
             BaseRetriever: Configured similarity search retriever
-        
+
         Raises:
             RuntimeError: On retriever or vector store initialization failures
-        
-        Example:
-            retriever = llm_service.get_retriever()
-            docs = retriever.get_relevant_documents("query")
         """
         logger.info("Setting up retriever...")
         try:
@@ -142,6 +215,18 @@ class LLMService:
             logger.error(f"Failed to initialize retriever: {str(e)}")
             raise RuntimeError(f"Error initializing retriever: {e}")
 
-llm = LLMService()._initialize_llm()
-retriever = LLMService().get_retriever()
-embeddings = LLMService()._initialize_embeddings()
\ No newline at end of file
+    def warmup(self) -> None:
+        """
+        Load the chat model, embeddings and vector store ahead of the first request.
+
+        Safe to call more than once and from several threads; components that are
+        already initialized are reused, and a caller that needs a component still
+        being loaded waits for it.
+
+        Raises:
+            RuntimeError: On any component initialization failure
+        """
+        self.get_llm()
+        self.get_retriever()
+
+llm_service = LLMService()
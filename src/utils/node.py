@@ -1,14 +1,98 @@
+import threading
 from pydantic import BaseModel, Field
 from typing import Literal, Dict, Any
 from langchain_core.prompts import ChatPromptTemplate
-from langchain.retrievers.multi_query import MultiQueryRetriever
-from langchain.retrievers import ContextualCompressionRetriever
-from langchain.retrievers.document_compressors import FlashrankRerank, DocumentCompressorPipeline
-from langchain_community.document_transformers import EmbeddingsRedundantFilter
-from langchain.schema import AIMessage
+from langchain_core.messages import AIMessage
 from src.config.logger import logger
+from src.config.profiler import profiler
 from src.utils.state import GraphState
-from src.utils.llm import llm, retriever, embeddings
+from src.utils.llm import llm_service
+
+# Prompts are compiled once at import. Each one keeps the static instructions in
+# the system message and puts the per-call context, chat history and question in
+# the trailing human message, so every request shares a byte-identical prefix
+# that provider-side prompt caching can reuse.
+
+class RouteQuery(BaseModel):
+    category: Literal["retriever", "general"] = Field(
+        ..., description="Route the query to general or vectorstore."
+    )
+
+ROUTER_SYSTEM_PROMPT = """You are an intelligent routing system responsible for analyzing and directing user queries efficiently.
+
+OBJECTIVE:
+Determine whether a query requires document retrieval or can be answered with general knowledge.
+
+INSTRUCTIONS:
+1. Analyze the query for:
+   - Specific technical details requiring documentation
+   - General conceptual questions
+   - Context from previous conversation
+
+2. Categorize queries as:
+   - 'retriever': For questions about:
+      * Specific DSPy documentation
+      * Technical implementations
+      * Code examples
+      * API usage
+      * Framework specifics
+
+   - 'general': For questions about:
+      * Basic Chit Chat
+
+EXAMPLES:
+- "How do I implement DSPy's Predict module?" → retriever
+- "What is RAG in general?" → general
+- "Show me DSPy code examples" → retriever
+- "Explain the concept of language models" → general
+"""
+
+ROUTER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ROUTER_SYSTEM_PROMPT),
+    ("human", "## CHAT HISTORY\n{chat_history}\n\nQuestion: \n\n {question}")
+])
+
+GENERAL_ANSWER_SYSTEM_PROMPT = """You are a professional AI assistant.
+Your role is to handle chit-chat and casual conversation in a polite, friendly, and professional tone.
+
+## GUIDELINES
+- Keep responses short, warm, and natural.
+- Maintain professionalism while staying approachable.
+- Acknowledge greetings or casual remarks politely.
+- Avoid technical or factual answers — focus only on conversation flow.
+- If a question can be answered using the context from chat history, do answer the question.
+- If asked about anything outside chit-chat (e.g., facts, news, technical questions), respond with:
+"My capabilities are limited to chit-chat. I cannot answer that question."
+"""
+
+GENERAL_ANSWER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", GENERAL_ANSWER_SYSTEM_PROMPT),
+    ("human", "## CHAT HISTORY\n{chat_history}\n\nQuestion: \n\n {question}")
+])
+
+ANSWER_GENERATION_SYSTEM_PROMPT = """You are a specialized AI assistant for the **DSPy framework**.
+Answer queries only when relevant DSPy documentation is provided in context.
+
+## RULES
+1. Use **only** the given context to answer.
+2. If the question is not related to DSPy, or the context is insufficient, reply exactly with:
+- "I do not have capabilities to answer this question."
+OR
+- "I do not get enough context to answer that question."
+3. Never guess, assume, or generate content outside the context.
+
+## RESPONSE STYLE
+- Start with a clear, direct answer.
+- Use **bold** for key terms.
+- Use bullet points or numbered steps for clarity.
+- Put code in ```code blocks``` if provided.
+- Cite documentation sections from context when possible.
+"""
+
+ANSWER_GENERATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ANSWER_GENERATION_SYSTEM_PROMPT),
+    ("human", "## AVAILABLE CONTEXT\n{context}\n\n## CHAT HISTORY\n{chat_history}\n\nQuestion: \n\n {question}")
+])
 
 class Node:
     """A class handling various nodes in the conversation processing pipeline.
@@ -20,8 +104,56 @@ class Node:
     - Context-aware answer generation
     
     Each node maintains state and can be chained together in a processing pipeline.
+    The router chain is composed once on first use from the module-level prompt.
+    The document compression pipeline (langchain retrievers, FlashRank and the
+    redundancy filter) is imported and built on first use and then reused.
     """
 
+    def __init__(self):
+        """Initialize the node handler without building the retrieval pipeline."""
+        self._router_chain = None
+        self._router_chain_lock = threading.Lock()
+        self._compression_retriever = None
+        self._compression_retriever_lock = threading.Lock()
+
+    def get_router_chain(self) -> Any:
+        """Compose the routing prompt with the structured-output model once and cache it.
+        
+        Returns:
+            RunnableSequence: ROUTER_PROMPT piped into the RouteQuery structured LLM
+        """
+        if self._router_chain is None:
+            with self._router_chain_lock:
+                if self._router_chain is None:
+                    self._router_chain = ROUTER_PROMPT | llm_service.get_llm().with_structured_output(RouteQuery)
+        return self._router_chain
+
+    def get_compression_retriever(self) -> Any:
+        """Build the multi-query, filtering and reranking retriever once and cache it.
+        
+        Returns:
+            ContextualCompressionRetriever: Retriever used by relevant_docs_node
+        """
+        if self._compression_retriever is None:
+            with self._compression_retriever_lock:
+                if self._compression_retriever is None:
+                    with profiler.track("import langchain retrievers"):
+                        from langchain.retrievers.multi_query import MultiQueryRetriever
+                        from langchain.retrievers import ContextualCompressionRetriever
+                        from langchain.retrievers.document_compressors import FlashrankRerank, DocumentCompressorPipeline
+                        from langchain_community.document_transformers import EmbeddingsRedundantFilter
+                    with profiler.track("init compression retriever"):
+                        compressor = FlashrankRerank(top_n=10)
+                        redundant_filter = EmbeddingsRedundantFilter(embeddings=llm_service.get_embeddings(), similarity_threshold=0.95)
+                        compressor_pipeline = DocumentCompressorPipeline(transformers=[redundant_filter, compressor])
+                        retriever_from_llm = MultiQueryRetriever.from_llm(
+                            retriever=llm_service.get_retriever(), llm=llm_service.get_llm(), include_original=True
+                        )
+                        self._compression_retriever = ContextualCompressionRetriever(
+                            base_compressor=compressor_pipeline, base_retriever=retriever_from_llm
+                        )
+        return self._compression_retriever
+
     def router_node(self, state: GraphState):
         """Route user queries to appropriate processing nodes.
         
@@ -32,52 +164,7 @@ class Node:
             Dict[str, Any]: Updated state with routing 'category'
         """
         try:
-            class RouteQuery(BaseModel):
-                category: Literal["retriever", "general"] = Field(
-                    ..., description="Route the query to general or vectorstore."
-                )
-
-            structured_llm_router = llm.with_structured_output(RouteQuery)
-
-            system = """You are an intelligent routing system responsible for analyzing and directing user queries efficiently.
-
-            OBJECTIVE:
-            Determine whether a query requires document retrieval or can be answered with general knowledge.
-
-            INSTRUCTIONS:
-            1. Analyze the query for:
-               - Specific technical details requiring documentation
-               - General conceptual questions
-               - Context from previous conversation
-
-            2. Categorize queries as:
-               - 'retriever': For questions about:
-                  * Specific DSPy documentation
-                  * Technical implementations
-                  * Code examples
-                  * API usage
-                  * Framework specifics
-               
-               - 'general': For questions about:
-                  * Basic Chit Chat
-
-            EXAMPLES:
-            - "How do I implement DSPy's Predict module?" → retriever
-            - "What is RAG in general?" → general
-            - "Show me DSPy code examples" → retriever
-            - "Explain the concept of language models" → general
-                ## CHAT HISTORY
-                {chat_history}
-
-
-            """
-            route_prompt = ChatPromptTemplate.from_messages([
-                ("system", system),
-                ("human", "Question: \n\n {question}")
-            ])
-
-            question_router = route_prompt | structured_llm_router
-            
+            question_router = self.get_router_chain()
             response = question_router.invoke({
                 "question": state["messages"][-1].content if state["messages"] else "",
                 "chat_history": state["messages"][-4:] if state["messages"] else []
@@ -99,31 +186,11 @@ class Node:
         """
         logger.info("Processing general knowledge query")
         try:
-            instructions = """You are a professional AI assistant.  
-                Your role is to handle chit-chat and casual conversation in a polite, friendly, and professional tone.  
-
-                ## GUIDELINES
-                - Keep responses short, warm, and natural.  
-                - Maintain professionalism while staying approachable.  
-                - Acknowledge greetings or casual remarks politely.  
-                - Avoid technical or factual answers — focus only on conversation flow.
-                - If a question can be answered using the context from chat history, do answer the question.  
-                - If asked about anything outside chit-chat (e.g., facts, news, technical questions), respond with:  
-                "My capabilities are limited to chit-chat. I cannot answer that question."  
-                
-                ## INPUT
-                Current query: {question}  
-                Chat history: {chat_history}
-            """
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", instructions),
-                ("human", "Question: \n\n {question}")
-            ])
-            messages = prompt_template.invoke({
+            messages = GENERAL_ANSWER_PROMPT.invoke({
                 "question": state["messages"][-1].content if state["messages"] else "",
                 "chat_history": state["messages"][-4:] if state["messages"] else []
             })
-            response = llm.invoke(messages)
+            response = llm_service.get_llm().invoke(messages)
             logger.info("Generated general knowledge response")
             ai_message = AIMessage(content=response.content)
             return {"messages": [ai_message]}
@@ -142,13 +209,7 @@ class Node:
         """
         logger.info("Retrieving relevant documents")
         try:
-            compressor = FlashrankRerank(top_n=10)
-            redundant_filter = EmbeddingsRedundantFilter(embeddings=embeddings, similarity_threshold=0.95)
-            compressor_pipeline = DocumentCompressorPipeline(transformers=[redundant_filter, compressor])
-            retriever_from_llm = MultiQueryRetriever.from_llm(retriever=retriever, llm=llm, include_original=True)
-            compression_retriever = ContextualCompressionRetriever(
-                base_compressor=compressor_pipeline, base_retriever=retriever_from_llm
-            )
+            compression_retriever = self.get_compression_retriever()
             docs = compression_retriever.invoke(state["messages"][-1].content if state["messages"] else "")
             state["relevant_docs"] = "\n\n".join(doc.page_content for doc in docs)
             logger.info(f"Retrieved {len(docs)} relevant documents")
@@ -168,43 +229,12 @@ class Node:
         """
         logger.info("Generating answer from documents")
         try:
-            instructions = """You are a specialized AI assistant for the **DSPy framework**.  
-                Answer queries only when relevant DSPy documentation is provided in context.  
-
-                ## RULES
-                1. Use **only** the given context to answer.  
-                2. If the question is not related to DSPy, or the context is insufficient, reply exactly with:  
-                - "I do not have capabilities to answer this question."  
-                OR  
-                - "I do not get enough context to answer that question."  
-                3. Never guess, assume, or generate content outside the context.  
-
-                ## RESPONSE STYLE
-                - Start with a clear, direct answer.  
-                - Use **bold** for key terms.  
-                - Use bullet points or numbered steps for clarity.  
-                - Put code in ```code blocks``` if provided.  
-                - Cite documentation sections from context when possible.  
-
-            AVAILABLE CONTEXT:
-            {context}
-
-            CHAT HISTORY:
-            {chat_history}
-
-            CURRENT QUERY:
-            {question}
-            """
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", instructions),
-                ("human", "Question: \n\n {question}")
-            ])
-            messages = prompt_template.invoke({
+            messages = ANSWER_GENERATION_PROMPT.invoke({
                 "context": state["relevant_docs"],
                 "question": state["messages"][-1].content if state["messages"] else "",
                 "chat_history": state["messages"][-4:] if state["messages"] else []
             })
-            response = llm.invoke(messages)
+            response = llm_service.get_llm().invoke(messages)
             ai_message = AIMessage(content=response.content)
             return {"messages": [ai_message]}
         except Exception as e:
@@ -19,24 +19,97 @@ Example:
         config=config
     ):
         step["messages"][-1].pretty_print()
+
+Importing this module only compiles the graph; models, the vector store, the
+router chain and the reranker are loaded by `warmup()`. Unless BACKGROUND_WARMUP
+is disabled, a background warmup is scheduled at import and starts
+WARMUP_DELAY_SECONDS later, once the server has had time to finish starting up
+and accept connections. A request that reaches the router before then starts it
+immediately. Anything not yet warmed up is initialized on first use.
 """
 
+import threading
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
+from src.config.config import settings
+from src.config.logger import logger
+from src.config.profiler import profiler
 from src.utils.node import node
 from src.utils.edge import edge
 from src.utils.state import GraphState
+from src.utils.llm import llm_service
 
 #uncomment this if not running locally with Langsmith and langgraoh studio.
 #memory = MemorySaver()
 
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_warmup_now = threading.Event()
+
+def _warmup() -> None:
+    """
+    Load every heavy component.
+
+    Raises:
+        RuntimeError: On any component initialization failure
+    """
+    logger.info("Warming up workflow components...")
+    with profiler.track("warmup llm service"):
+        llm_service.warmup()
+    with profiler.track("warmup router chain"):
+        node.get_router_chain()
+    with profiler.track("warmup compression retriever"):
+        node.get_compression_retriever()
+    logger.info("Warmup completed successfully")
+
+def _run_warmup(delay: float) -> None:
+    """Wait for the delay or an earlier trigger, then warm up, logging instead of raising on failure."""
+    _warmup_now.wait(timeout=delay)
+    try:
+        _warmup()
+    except Exception as e:
+        logger.error(f"Warmup failed, components will be initialized on first use: {str(e)}")
+
+def warmup(background: bool = True, delay: float = 0.0) -> None:
+    """
+    Load models, the vector store, the router chain and the reranker before the
+    nodes that need them run.
+
+    Args:
+        background (bool, optional): Run in a daemon thread so the caller returns
+            immediately. Only one background warmup is started. Defaults to True.
+        delay (float, optional): Seconds the background thread waits before
+            starting. A later call with no delay starts a pending warmup right
+            away. Defaults to 0.0.
+
+    Raises:
+        RuntimeError: When run in the foreground and a component fails to load
+    """
+    global _warmup_thread
+    if not background:
+        _warmup()
+        return
+    if delay <= 0:
+        _warmup_now.set()
+    with _warmup_lock:
+        if _warmup_thread is not None:
+            return
+        _warmup_thread = threading.Thread(target=_run_warmup, args=(delay,), name="workflow-warmup", daemon=True)
+    _warmup_thread.start()
+
 class Workflow:
+
+    def router_node(self, state: GraphState):
+        """Start the background warmup now if it is still pending, then route the query."""
+        if settings.BACKGROUND_WARMUP:
+            warmup()
+        return node.router_node(state)
     
     def create_graph(self) -> StateGraph:
         workflow = StateGraph(GraphState)
 
         # Add nodes
-        workflow.add_node("router_node", node.router_node)
+        workflow.add_node("router_node", self.router_node)
         workflow.add_node("general_answer_node", node.general_answer_node)
         workflow.add_node("relevant_docs_node", node.relevant_docs_node)
         workflow.add_node("answer_generation_node", node.answer_generation_node)
@@ -62,4 +135,8 @@ class Workflow:
         #return workflow.compile(checkpointer=memory)
         return workflow.compile()
     
-graph = Workflow().create_graph()    
\ No newline at end of file
+with profiler.track("compile graph"):
+    graph = Workflow().create_graph()
+
+if settings.BACKGROUND_WARMUP:
+    warmup(delay=settings.WARMUP_DELAY_SECONDS)
\ No newline at end of file
@@ -0,0 +1,20 @@
+import pytest
+
+APP_ENV = {
+    "GROQ_API_KEY": "test",
+    "GROQ_MODEL": "test",
+    "EMBEDDINGS_MODEL": "test",
+    "PERSIST_DIRECTORY": "embeddings_db",
+    "LANGSMITH_API_KEY": "test",
+    "LANGSMITH_ENDPOINT": "http://localhost",
+    "LANGSMITH_PROJECT": "test",
+    "LANGSMITH_TRACING": "false",
+}
+
+
+@pytest.fixture
+def app_env(monkeypatch):
+    """Set the environment variables Settings requires, for the current test only."""
+    for name, value in APP_ENV.items():
+        monkeypatch.setenv(name, value)
+    return APP_ENV
@@ -0,0 +1,59 @@
+import importlib
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+FIRST_CALL = {
+    "question": "How do I configure the LM used by dspy.Predict?",
+    "chat_history": [HumanMessage(content="hello there"), AIMessage(content="Hi! How can I help?")],
+    "context": "dspy.Predict takes a signature and calls the configured LM.",
+}
+
+SECOND_CALL = {
+    "question": "What does ChainOfThought add?",
+    "chat_history": [HumanMessage(content="tell me about optimizers")],
+    "context": "dspy.ChainOfThought adds a reasoning field before the output.",
+}
+
+PROMPTS = [
+    pytest.param("ROUTER_PROMPT", ["question", "chat_history"], id="router"),
+    pytest.param("GENERAL_ANSWER_PROMPT", ["question", "chat_history"], id="general_answer"),
+    pytest.param("ANSWER_GENERATION_PROMPT", ["question", "chat_history", "context"], id="answer_generation"),
+]
+
+
+@pytest.fixture
+def node_module(app_env):
+    """Import src.utils.node once the environment Settings needs is in place."""
+    return importlib.import_module("src.utils.node")
+
+
+def render(prompt, inputs, variables):
+    return prompt.invoke({name: inputs[name] for name in variables}).to_messages()
+
+
+@pytest.mark.parametrize("prompt, variables", PROMPTS)
+def test_system_prefix_is_byte_identical_across_calls(node_module, prompt, variables):
+    prompt = getattr(node_module, prompt)
+    first = render(prompt, FIRST_CALL, variables)
+    second = render(prompt, SECOND_CALL, variables)
+
+    assert isinstance(first[0], SystemMessage)
+    assert isinstance(second[0], SystemMessage)
+    assert first[0].content.encode() == second[0].content.encode()
+
+
+@pytest.mark.parametrize("prompt, variables", PROMPTS)
+def test_variable_fields_only_in_trailing_human_message(node_module, prompt, variables):
+    prompt = getattr(node_module, prompt)
+    for inputs in (FIRST_CALL, SECOND_CALL):
+        messages = render(prompt, inputs, variables)
+        *prefix, last = messages
+
+        assert isinstance(last, HumanMessage)
+        markers = [inputs["question"], inputs["chat_history"][-1].content]
+        if "context" in variables:
+            markers.append(inputs["context"])
+        for marker in markers:
+            assert marker in last.content
+            assert all(marker not in message.content for message in prefix)
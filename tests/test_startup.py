@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = [
+    "langchain_groq",
+    "langchain_huggingface",
+    "langchain_chroma",
+    "chromadb",
+    "flashrank",
+    "sentence_transformers",
+    "torch",
+]
+
+# Records every attempt to import a heavy library, whether or not it is installed,
+# and every call to an LLMService initializer, before the graph module is imported.
+SCRIPT = f"""
+import os
+import sys
+
+HEAVY_MODULES = {HEAVY_MODULES!r}
+attempted = []
+
+class RecordingFinder:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in HEAVY_MODULES:
+            attempted.append(name)
+        return None
+
+sys.meta_path.insert(0, RecordingFinder())
+
+from src.utils.llm import LLMService
+
+initialized = []
+
+def record(method):
+    def wrapper(self, *args, **kwargs):
+        initialized.append(method)
+        raise RuntimeError(f"{{method}} called during import")
+    return wrapper
+
+for method in ("_initialize_llm", "_initialize_embeddings", "_initialize_vectorstore", "_initialize_retriever"):
+    setattr(LLMService, method, record(method))
+
+import src.utils.workflow as workflow
+
+assert workflow.graph is not None
+assert not initialized, f"LLMService initializers called at startup: {{initialized}}"
+assert not attempted, f"heavy modules imported at startup: {{attempted}}"
+loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+assert not loaded, f"heavy modules loaded at startup: {{loaded}}"
+expect_scheduled = os.environ["BACKGROUND_WARMUP"] == "true"
+assert (workflow._warmup_thread is not None) == expect_scheduled
+assert not workflow._warmup_now.is_set()
+"""
+
+
+@pytest.mark.parametrize("background_warmup", ["false", "true"])
+def test_importing_graph_does_not_load_heavy_modules(app_env, background_warmup):
+    env = {
+        **os.environ,
+        "BACKGROUND_WARMUP": background_warmup,
+        "WARMUP_DELAY_SECONDS": "60",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr